@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+Claude Code Hook Relay: Forward Queued Events to Observability Server
+
+send_event.py hands each event to this long-lived process over a Unix
+datagram socket and exits immediately, so Claude Code never waits on the
+observability POST. The relay owns the network side: it coalesces events
+into batched POSTs over one pooled connection, rate limits each hook type
+and stops posting while the server is down.
+
+Usage: python .claude/hooks/event_relay.py
+"""
+
+import gzip
+import os
+import signal
+import socket
+import sys
+import time
+
+from send_event import (
+    OBSERVABILITY_SERVER_URL,
+    RELAY_SOCKET_PATH,
+    post_body,
+)
+
+# Configuration
+OBSERVABILITY_BATCH_URL = OBSERVABILITY_SERVER_URL + "/batch"
+MAX_DATAGRAM_BYTES = 4 * 1024 * 1024
+BATCH_WINDOW_SECONDS = 0.1  # How long to wait for more events before flushing
+BATCH_MAX_BYTES = 64 * 1024
+GZIP_MIN_BYTES = 1024
+
+HEADERS = {
+    "Content-Type": "application/json",
+    "User-Agent": "ClaudeCodeHook/1.0",
+}
+RATE_LIMIT_PER_MINUTE = 1000  # Per hook type
+FAILURE_THRESHOLD = 5  # Consecutive failed POSTs before the circuit opens
+RECOVERY_SECONDS = 300  # How long the circuit stays open
+
+
+class CircuitBreaker:
+    """Stop sending after repeated failures and retry after a recovery period."""
+
+    def __init__(self, failure_threshold: int = FAILURE_THRESHOLD, recovery_seconds: float = RECOVERY_SECONDS):
+        self.failure_threshold = failure_threshold
+        self.recovery_seconds = recovery_seconds
+        self.failures = 0
+        self.opened_at = None
+
+    def allow(self) -> bool:
+        """Return True if a request may be sent now."""
+        if self.opened_at is None:
+            return True
+        # Half-open: let one request through once the recovery period has passed
+        return time.monotonic() - self.opened_at >= self.recovery_seconds
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self.opened_at = None
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self.failures >= self.failure_threshold:
+            if self.opened_at is None:
+                print(
+                    f"[Relay] Observability server unavailable, pausing for {self.recovery_seconds}s",
+                    file=sys.stderr,
+                )
+            self.opened_at = time.monotonic()
+
+
+class RateLimiter:
+    """Fixed one-minute window event budget per component."""
+
+    def __init__(self, limit_per_minute: int = RATE_LIMIT_PER_MINUTE):
+        self.limit = limit_per_minute
+        self.window_start = time.monotonic()
+        self.counts = {}
+
+    def allow(self, component: str) -> bool:
+        """Return True if the component still has budget in the current window."""
+        now = time.monotonic()
+        if now - self.window_start >= 60:
+            self.window_start = now
+            self.counts.clear()
+
+        count = self.counts.get(component, 0)
+        if count >= self.limit:
+            return False
+        self.counts[component] = count + 1
+        return True
+
+
+def bind_socket(path: str) -> socket.socket:
+    """Bind the relay socket, replacing a stale socket file left by a dead relay."""
+    os.makedirs(os.path.dirname(path), mode=0o700, exist_ok=True)
+
+    if os.path.exists(path):
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        try:
+            probe.connect(path)
+        except OSError:
+            os.unlink(path)
+        else:
+            print(f"[Relay] Another relay is already listening on {path}", file=sys.stderr)
+            sys.exit(1)
+        finally:
+            probe.close()
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+    # Create the socket file readable and writable by this user only
+    old_umask = os.umask(0o177)
+    try:
+        sock.bind(path)
+    finally:
+        os.umask(old_umask)
+    return sock
+
+
+class EventForwarder:
+    """POST events to the observability server, batching when it supports it."""
+
+    def __init__(self, breaker: CircuitBreaker):
+        self.breaker = breaker
+        self.batch_supported = True
+
+    def send(self, bodies: list) -> None:
+        """Send a group of encoded events as a single request where possible."""
+        if not self.breaker.allow():
+            return
+
+        if len(bodies) > 1 and self.batch_supported:
+            body = b"[" + b",".join(bodies) + b"]"
+            headers = dict(HEADERS)
+            if len(body) > GZIP_MIN_BYTES:
+                body = gzip.compress(body)
+                headers["Content-Encoding"] = "gzip"
+
+            status = self._post(OBSERVABILITY_BATCH_URL, body, headers)
+            if status not in (404, 405):
+                return
+            # Older servers only accept single events on /events
+            print("[Relay] Batch endpoint not available, sending events individually", file=sys.stderr)
+            self.batch_supported = False
+
+        for body in bodies:
+            if self._post(OBSERVABILITY_SERVER_URL, body, HEADERS) is None:
+                return
+
+    def _post(self, url: str, body: bytes, headers: dict):
+        """POST one body, updating the circuit breaker with the outcome."""
+        status = post_body(url, body, headers)
+        if status is None or status >= 500:
+            self.breaker.record_failure()
+            return None
+
+        self.breaker.record_success()
+        if status != 200 and url != OBSERVABILITY_BATCH_URL:
+            print(f"[Relay] Observability server returned {status}", file=sys.stderr)
+        return status
+
+
+def collect_batch(sock: socket.socket, limiter: RateLimiter) -> list:
+    """Block for the next event, then gather more until the batch window or size limit is hit."""
+    bodies = []
+    size = 0
+    sock.settimeout(None)
+    deadline = None
+
+    while size < BATCH_MAX_BYTES:
+        if deadline is not None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            sock.settimeout(remaining)
+
+        try:
+            datagram = sock.recv(MAX_DATAGRAM_BYTES)
+        except socket.timeout:
+            break
+
+        hook_type, _, body = datagram.partition(b"\n")
+        if not limiter.allow(hook_type.decode("utf-8", "replace")):
+            continue
+
+        bodies.append(body)
+        size += len(body)
+        if deadline is None:
+            deadline = time.monotonic() + BATCH_WINDOW_SECONDS
+
+    return bodies
+
+
+def main():
+    """Relay entry point."""
+    if not hasattr(socket, "AF_UNIX"):
+        print("[Relay] Unix domain sockets are not supported on this platform", file=sys.stderr)
+        sys.exit(1)
+
+    # Exit through the finally block below so the socket file is removed
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+
+    sock = bind_socket(RELAY_SOCKET_PATH)
+    forwarder = EventForwarder(CircuitBreaker())
+    limiter = RateLimiter()
+    print(f"[Relay] Forwarding events from {RELAY_SOCKET_PATH} to {OBSERVABILITY_SERVER_URL}", file=sys.stderr)
+
+    try:
+        while True:
+            forwarder.send(collect_batch(sock, limiter))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        sock.close()
+        os.unlink(RELAY_SOCKET_PATH)
+
+
+if __name__ == "__main__":
+    main()
@@ -6,15 +6,105 @@ This hook forwards Claude Code events to the observability dashboard.
 Automatically called by Claude Code when configured in .claude/settings.json
 """
 
-import json
+import os
+import socket
+import stat
 import sys
-import urllib.request
-from datetime import datetime
+import time
 from pathlib import Path
+from typing import Optional
+
+try:
+    import orjson
+
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+    JSONDecodeError = orjson.JSONDecodeError
+except ImportError:
+    # Fall back to the stdlib so the hook still runs without orjson installed
+    import json
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+    _loads = json.loads
+    JSONDecodeError = json.JSONDecodeError
 
 # Configuration
 OBSERVABILITY_SERVER_URL = "http://localhost:4000/events"
 TIMEOUT_SECONDS = 2
+# Per-user location so no other local user can bind the socket and receive events
+RELAY_SOCKET_PATH = str(Path.home() / ".claude" / "hooks" / "relay.sock")
+
+# Shared keep-alive pool, created on first direct POST (see post_body)
+_http = None
+
+
+def enqueue_event(hook_type: str, body: bytes) -> bool:
+    """
+    Hand an encoded event to the relay daemon without waiting on the network.
+
+    Returns False when no relay is listening, the socket is not owned by the
+    current user or the datagram cannot be sent, in which case the caller
+    should POST the event itself.
+    """
+    if not hasattr(socket, "AF_UNIX") or not hasattr(os, "getuid"):
+        return False
+
+    try:
+        # Only hand events to a socket owned by this user
+        st = os.lstat(RELAY_SOCKET_PATH)
+        if not stat.S_ISSOCK(st.st_mode) or st.st_uid != os.getuid():
+            return False
+
+        with socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM) as sock:
+            sock.setblocking(False)
+            sock.sendto(hook_type.encode("utf-8") + b"\n" + body, RELAY_SOCKET_PATH)
+        return True
+    except OSError:
+        return False
+
+
+def post_body(url: str, body: bytes, headers: dict) -> Optional[int]:
+    """
+    POST an encoded body to the observability server.
+
+    Returns the HTTP status code, or None if the server could not be reached.
+    """
+    global _http
+
+    try:
+        import urllib3
+    except ImportError:
+        return _post_with_urllib(url, body, headers)
+
+    if _http is None:
+        _http = urllib3.PoolManager(
+            num_pools=1,
+            maxsize=4,
+            timeout=urllib3.Timeout(connect=1.0, read=TIMEOUT_SECONDS),
+            retries=False,
+        )
+
+    try:
+        return _http.request("POST", url, body=body, headers=headers).status
+    except urllib3.exceptions.HTTPError:
+        return None
+
+
+def _post_with_urllib(url: str, body: bytes, headers: dict) -> Optional[int]:
+    """Stdlib fallback for post_body when urllib3 is not installed."""
+    import urllib.error
+    import urllib.request
+
+    req = urllib.request.Request(url, data=body, headers=headers)
+    try:
+        with urllib.request.urlopen(req, timeout=TIMEOUT_SECONDS) as response:
+            return response.status
+    except urllib.error.HTTPError as e:
+        return e.code
+    except OSError:
+        return None
 
 
 def send_event(hook_type: str, event_data: dict) -> None:
@@ -29,7 +119,7 @@ def send_event(hook_type: str, event_data: dict) -> None:
             "session_id": session_id,
             "hook_event_type": hook_type,
             "payload": event_data,
-            "timestamp": int(datetime.now().timestamp() * 1000),
+            "timestamp": time.time_ns() // 1_000_000,
         }
         
         # Add summary based on hook type
@@ -45,26 +135,27 @@ def send_event(hook_type: str, event_data: dict) -> None:
             if "chatTranscript" in event_data:
                 payload["payload"]["chat_transcript"] = event_data["chatTranscript"]
         
-        # Send request
-        req = urllib.request.Request(
+        body = _dumps(payload)
+
+        # Prefer the relay daemon so Claude Code is not blocked on the POST
+        if enqueue_event(hook_type, body):
+            return
+
+        # Send request (None means the observability server is not running)
+        status = post_body(
             OBSERVABILITY_SERVER_URL,
-            data=json.dumps(payload).encode("utf-8"),
-            headers={
+            body,
+            {
                 "Content-Type": "application/json",
                 "User-Agent": "ClaudeCodeHook/1.0",
             },
         )
-        
-        with urllib.request.urlopen(req, timeout=TIMEOUT_SECONDS) as response:
-            if response.status != 200:
-                print(
-                    f"[Hook] Observability server returned {response.status}",
-                    file=sys.stderr,
-                )
+        if status is not None and status != 200:
+            print(
+                f"[Hook] Observability server returned {status}",
+                file=sys.stderr,
+            )
     
-    except urllib.error.URLError as e:
-        # Silently fail if observability server is not running
-        pass
     except Exception as e:
         print(f"[Hook] Error sending event: {e}", file=sys.stderr)
 
@@ -79,8 +170,8 @@ def main():
     
     # Read event data from stdin
     try:
-        event_data = json.load(sys.stdin)
-    except json.JSONDecodeError as e:
+        event_data = _loads(sys.stdin.buffer.read())
+    except JSONDecodeError as e:
         print(f"[Hook] Failed to parse JSON from stdin: {e}", file=sys.stderr)
         sys.exit(1)
     
@@ -1,6 +1,13 @@
-"""Run the development server."""
+"""Run the development or production server."""
+import os
+import sys
 import uvicorn
 
+# libuv event loop and C HTTP parser, both installed by uvicorn[standard]
+# (uvloop is not available on Windows)
+LOOP = "asyncio" if sys.platform == "win32" else "uvloop"
+HTTP = "httptools"
+
 
 def main():
     """Start the development server with reload enabled."""
@@ -9,6 +16,24 @@ def main():
         host="0.0.0.0",
         port=4444,
         reload=True,
+        loop=LOOP,
+        http=HTTP,
+    )
+
+
+def serve():
+    """Start the production server with one worker per CPU and no access log."""
+    # Workers would all rotate the same log file, so log to stdout only
+    os.environ["CONTENT_GEN_LOG_TO_FILE"] = "0"
+    uvicorn.run(
+        "content_gen_backend.main:app",
+        host="0.0.0.0",
+        port=4444,
+        workers=os.cpu_count(),
+        proxy_headers=True,
+        access_log=False,
+        loop=LOOP,
+        http=HTTP,
     )
 
 
@@ -1,5 +1,8 @@
 """Configuration settings for the Content Generation Backend."""
 
+from functools import lru_cache
+from typing import Optional
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -13,9 +16,12 @@ class Settings(BaseSettings):
     default_size: str = "1280x720"
     default_seconds: int = 4
     max_file_size: int = 10485760  # 10MB
+    otel_exporter_otlp_endpoint: Optional[str] = None  # Enables tracing when set
 
     model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8")
 
 
-# Global settings instance
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the settings instance, reading the environment on first use."""
+    return Settings()
@@ -0,0 +1,58 @@
+"""Request dependencies for the services built at application startup."""
+
+from typing import Annotated
+
+from fastapi import Depends, FastAPI, Request
+from .config import Settings, get_settings
+from .services import SoraService, StorageService, VideoStatusBroadcaster
+
+
+def resolve_settings(app: FastAPI) -> Settings:
+    """
+    Return the settings for an application, honoring dependency overrides.
+
+    Used outside of a request (e.g. in the lifespan), where Depends is not
+    available.
+
+    Args:
+        app: FastAPI application
+
+    Returns:
+        Settings instance
+    """
+    return app.dependency_overrides.get(get_settings, get_settings)()
+
+
+def init_services(app: FastAPI, settings: Settings) -> None:
+    """
+    Build the services and store them on the application state.
+
+    Args:
+        app: FastAPI application
+        settings: Application settings
+    """
+    sora_service = SoraService(settings.openai_api_key)
+    app.state.sora_service = sora_service
+    app.state.storage_service = StorageService(settings.video_storage_path)
+    app.state.status_broadcaster = VideoStatusBroadcaster(sora_service, settings.max_poll_timeout)
+
+
+def get_sora_service(request: Request) -> SoraService:
+    """Return the application's SoraService."""
+    return request.app.state.sora_service
+
+
+def get_storage_service(request: Request) -> StorageService:
+    """Return the application's StorageService."""
+    return request.app.state.storage_service
+
+
+def get_status_broadcaster(request: Request) -> VideoStatusBroadcaster:
+    """Return the application's VideoStatusBroadcaster."""
+    return request.app.state.status_broadcaster
+
+
+SettingsDep = Annotated[Settings, Depends(get_settings)]
+SoraServiceDep = Annotated[SoraService, Depends(get_sora_service)]
+StorageServiceDep = Annotated[StorageService, Depends(get_storage_service)]
+StatusBroadcasterDep = Annotated[VideoStatusBroadcaster, Depends(get_status_broadcaster)]
@@ -1,12 +1,44 @@
-from fastapi import FastAPI
+import asyncio
+import logging
+from contextlib import asynccontextmanager, suppress
+
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from .dependencies import init_services, resolve_settings
 from .routers import videos
+from .services import VideoNotFoundError
+from .services.http_client import close_http_client
 from .utils.logging_setup import logger
+from .utils.telemetry import setup_telemetry
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application startup and shutdown."""
+    logger.info("Application starting up...")
+    # Settings and services are built here, in each worker, rather than at import
+    settings = resolve_settings(app)
+    # Tracing for requests and outbound OpenAI calls (no-op unless configured)
+    setup_telemetry(app, settings.otel_exporter_otlp_endpoint)
+    init_services(app, settings)
+    logger.info("Video API endpoints available at /api/v1/videos")
+    # Reclaim stored content left unreferenced by deleted videos
+    gc_task = asyncio.create_task(app.state.storage_service.run_garbage_collection())
+    yield
+    logger.info("Application shutting down...")
+    gc_task.cancel()
+    with suppress(asyncio.CancelledError):
+        await gc_task
+    await close_http_client()
+
 
 app = FastAPI(
     title="Content Gen Backend",
     description="AI-powered content generation with Sora video API",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 # CORS middleware
@@ -14,31 +46,28 @@ app.add_middleware(
     CORSMiddleware,
     allow_origins=["http://localhost:3333", "http://localhost:3334", "http://localhost:5173"],
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "DELETE", "OPTIONS"],
+    allow_headers=["Content-Type", "Authorization"],
+    max_age=86400,  # Let browsers cache preflight responses for a day
 )
 
 # Include routers
 app.include_router(videos.router)
 
+
+@app.exception_handler(VideoNotFoundError)
+async def video_not_found_handler(request: Request, exc: VideoNotFoundError):
+    """Map missing videos to 404 for every endpoint."""
+    return ORJSONResponse(status_code=404, content={"detail": str(exc)})
+
+
 logger.info("FastAPI application initialized")
 
 
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
-    logger.debug("Health check requested")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Health check requested")
     return {"status": "healthy", "service": "content-gen-backend", "version": "1.0.0"}
 
-
-@app.on_event("startup")
-async def startup_event():
-    """Application startup event."""
-    logger.info("Application starting up...")
-    logger.info("Video API endpoints available at /api/v1/videos")
-
-
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Application shutdown event."""
-    logger.info("Application shutting down...")
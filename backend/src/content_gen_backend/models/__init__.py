@@ -1,10 +1,11 @@
 """Pydantic models for video generation."""
 
-from .video_request import CreateVideoRequest, RemixVideoRequest
+from .video_request import CreateVideoRequest, CreateVideoForm, RemixVideoRequest
 from .video_response import VideoJob, VideoListResponse, VideoDeleteResponse, ErrorDetail
 
 __all__ = [
     "CreateVideoRequest",
+    "CreateVideoForm",
     "RemixVideoRequest",
     "VideoJob",
     "VideoListResponse",
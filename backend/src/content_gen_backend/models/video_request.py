@@ -1,7 +1,8 @@
 """Request models for video generation endpoints."""
 
-from typing import Literal, Optional
-from pydantic import BaseModel, Field
+from typing import Annotated, Literal, Optional
+from fastapi import UploadFile
+from pydantic import BaseModel, BeforeValidator, ConfigDict, Field
 
 
 class CreateVideoRequest(BaseModel):
@@ -12,8 +13,8 @@ class CreateVideoRequest(BaseModel):
     seconds: Literal[4, 8, 12] = Field(default=4, description="Duration in seconds")
     size: str = Field(default="1280x720", description="Output resolution (widthxheight)")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "prompt": "A calico cat playing piano on stage under spotlight",
                 "model": "sora-2",
@@ -21,6 +22,23 @@ class CreateVideoRequest(BaseModel):
                 "size": "1280x720",
             }
         }
+    )
+
+
+class CreateVideoForm(CreateVideoRequest):
+    """
+    Multipart form for creating a new video.
+
+    Fields left out are None here and filled from settings by the endpoint.
+    """
+
+    model: Optional[Literal["sora-2", "sora-2-pro"]] = Field(None, description="Video generation model")
+    # Form values arrive as strings, so coerce before the literal check
+    seconds: Annotated[Optional[Literal[4, 8, 12]], BeforeValidator(int)] = Field(
+        None, description="Duration in seconds"
+    )
+    size: Optional[str] = Field(None, description="Output resolution (widthxheight)")
+    input_reference: Optional[UploadFile] = Field(None, description="Optional reference image")
 
 
 class RemixVideoRequest(BaseModel):
@@ -28,9 +46,10 @@ class RemixVideoRequest(BaseModel):
 
     prompt: str = Field(..., min_length=1, max_length=2000, description="Updated prompt for remix")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "prompt": "Change the cat to orange and add confetti falling"
             }
         }
+    )
@@ -1,7 +1,7 @@
 """Response models for video generation endpoints."""
 
 from typing import Optional, List, Literal
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class ErrorDetail(BaseModel):
@@ -27,8 +27,8 @@ class VideoJob(BaseModel):
     remixed_from_video_id: Optional[str] = Field(None, description="Source video ID if remix")
     error: Optional[ErrorDetail] = Field(None, description="Error details if failed")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "id": "video_abc123",
                 "object": "video",
@@ -40,6 +40,7 @@ class VideoJob(BaseModel):
                 "seconds": "4",
             }
         }
+    )
 
 
 class VideoListResponse(BaseModel):
@@ -1,88 +1,154 @@
 """API endpoints for video generation."""
 
-from typing import Optional, Literal, Annotated
-from fastapi import APIRouter, HTTPException, File, UploadFile, Form, Query
-from fastapi.responses import StreamingResponse
-from pydantic import field_validator, Field
-import io
+import zlib
+from typing import AsyncIterator, Optional, Literal, Annotated
+from fastapi import APIRouter, HTTPException, Request, Response, UploadFile, Form, Query
+from fastapi.responses import FileResponse, StreamingResponse
+from pydantic import BaseModel, field_validator, Field
 
 from ..models import (
     CreateVideoRequest,
+    CreateVideoForm,
     RemixVideoRequest,
+    ErrorDetail,
     VideoJob,
     VideoListResponse,
     VideoDeleteResponse,
 )
-from ..services import SoraService, StorageService
-from ..config import settings
+from ..dependencies import SettingsDep, SoraServiceDep, StatusBroadcasterDep, StorageServiceDep
+from ..services import VideoNotFoundError
+from ..services.storage_service import VARIANT_CONTENT_TYPES, VARIANT_EXTENSIONS
 from ..utils.logging_setup import logger
 
 router = APIRouter(prefix="/api/v1/videos", tags=["videos"])
 
-# Initialize services
-sora_service = SoraService()
-storage_service = StorageService()
+UPLOAD_CHUNK_SIZE = 64 * 1024
+STATUS_CACHE_TTL_MS = 1000  # Clients polling the same video within this window share one API call
+ALLOWED_IMAGE_TYPES = frozenset({"image/jpeg", "image/png", "image/webp"})
+
+# Download headers per variant, resolved once instead of on every request
+_DOWNLOAD_SUFFIXES = {variant: f"_{variant}{ext}" for variant, ext in VARIANT_EXTENSIONS.items()}
+
+
+async def _prepend_chunk(first_chunk: bytes, chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """Re-attach an already consumed first chunk to the rest of a stream."""
+    yield first_chunk
+    async for chunk in chunks:
+        yield chunk
+
+
+def _model_response(model: BaseModel, headers: Optional[dict] = None) -> Response:
+    """
+    Serialize a response model straight to JSON bytes.
+
+    Returning a Response skips FastAPI's re-validation of the model against
+    response_model and the second dict-to-JSON pass; the route's
+    response_model still documents the schema. The model's serializer emits
+    bytes directly, unlike model_dump_json, whose str Response would encode again.
+    """
+    return Response(
+        content=model.__pydantic_serializer__.to_json(model), media_type="application/json", headers=headers
+    )
+
+
+def _status_etag(video: VideoJob) -> str:
+    """Build a weak ETag from the fields that change while a job is running."""
+    state = f"{video.status}:{video.progress}:{video.completed_at}".encode()
+    return f'W/"{zlib.crc32(state):08x}"'
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header against an ETag."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return etag in (tag.strip() for tag in if_none_match.split(","))
+
+
+async def _measure_upload(upload: UploadFile, max_size: int) -> int:
+    """
+    Return the size of an upload, reading at most max_size + 1 bytes in fixed chunks.
+
+    The upload is rewound afterwards so it can be passed on as a file.
+    """
+    if upload.size is not None:
+        return upload.size
+
+    total = 0
+    while total <= max_size:
+        chunk = await upload.read(UPLOAD_CHUNK_SIZE)
+        if not chunk:
+            break
+        total += len(chunk)
+
+    await upload.seek(0)
+    return total
+
+
+async def _status_events(first_video: VideoJob, updates: AsyncIterator[VideoJob]) -> AsyncIterator[str]:
+    """Format video status updates as server-sent events."""
+    yield f"event: status\ndata: {first_video.model_dump_json()}\n\n"
+    try:
+        async for video in updates:
+            yield f"event: status\ndata: {video.model_dump_json()}\n\n"
+    except Exception as e:
+        logger.error("Error streaming video status: %s", e, exc_info=True)
+        yield f"event: error\ndata: {ErrorDetail(message=str(e), type=type(e).__name__).model_dump_json()}\n\n"
 
 
 @router.post("", response_model=VideoJob, status_code=201)
 async def create_video(
-    prompt: str = Form(...),
-    model: Literal["sora-2", "sora-2-pro"] = Form(settings.default_model),
-    seconds: int = Form(settings.default_seconds),
-    size: str = Form(settings.default_size),
-    input_reference: Optional[UploadFile] = File(None),
+    form: Annotated[CreateVideoForm, Form(media_type="multipart/form-data")],
+    settings: SettingsDep,
+    sora_service: SoraServiceDep,
 ):
     """
     Create a new video generation job.
 
     Args:
-        prompt: Text description of the video to generate
-        model: Model to use (sora-2 or sora-2-pro)
-        seconds: Duration in seconds (4, 8, or 12)
-        size: Resolution as widthxheight (e.g., 1280x720)
-        input_reference: Optional reference image
+        form: Prompt, model (sora-2 or sora-2-pro), duration (4, 8, or 12 seconds),
+            resolution as widthxheight (e.g., 1280x720) and optional reference image
+        settings: Application settings, which supply defaults for omitted fields
 
     Returns:
         VideoJob with initial status
     """
     try:
-        # Validate seconds parameter
-        if seconds not in [4, 8, 12]:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Invalid duration. Must be 4, 8, or 12 seconds, got {seconds}",
-            )
-
-        logger.info(f"Received create video request: model={model}, seconds={seconds}, size={size}")
+        model = form.model or settings.default_model
+        seconds = form.seconds or settings.default_seconds
+        size = form.size or settings.default_size
+        logger.info("Received create video request: model=%s, seconds=%s, size=%s", model, seconds, size)
 
         # Handle input reference if provided
-        reference_bytes = None
+        reference_file = None
+        input_reference = form.input_reference
         if input_reference:
-            # Validate file size
-            content = await input_reference.read()
-            if len(content) > settings.max_file_size:
+            # Validate file size without loading the upload into memory
+            file_size = await _measure_upload(input_reference, settings.max_file_size)
+            if file_size > settings.max_file_size:
                 raise HTTPException(
                     status_code=413,
                     detail=f"File too large. Maximum size is {settings.max_file_size} bytes",
                 )
 
             # Validate file type
-            if not input_reference.content_type or not input_reference.content_type.startswith("image/"):
+            if input_reference.content_type not in ALLOWED_IMAGE_TYPES:
                 raise HTTPException(
                     status_code=400,
                     detail="Input reference must be an image (JPEG, PNG, or WebP)",
                 )
 
-            reference_bytes = content
-            logger.info(f"Reference image received: {input_reference.filename}, size: {len(content)} bytes")
+            reference_file = (input_reference.filename, input_reference.file, input_reference.content_type)
+            logger.info("Reference image received: %s, size: %s bytes", input_reference.filename, file_size)
 
         # Create video
         video = await sora_service.create_video(
-            prompt=prompt,
+            prompt=form.prompt,
             model=model,
             seconds=seconds,
             size=size,
-            input_reference=reference_bytes,
+            input_reference=reference_file,
         )
 
         return video
@@ -90,15 +156,18 @@ async def create_video(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error creating video: {str(e)}", exc_info=True)
+        logger.error("Error creating video: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail=f"Failed to create video: {str(e)}")
 
 
 @router.get("/{video_id}", response_model=VideoJob)
-async def get_video_status(video_id: str):
+async def get_video_status(video_id: str, request: Request, sora_service: SoraServiceDep):
     """
     Get the current status of a video generation job.
 
+    Responses carry a weak ETag; a poll whose If-None-Match still matches
+    gets an empty 304 instead of the full body.
+
     Args:
         video_id: The video job identifier
 
@@ -106,23 +175,40 @@ async def get_video_status(video_id: str):
         VideoJob with current status and progress
     """
     try:
-        logger.info(f"Fetching status for video: {video_id}")
+        logger.info("Fetching status for video: %s", video_id)
 
-        video = await sora_service.get_video_status(video_id)
-        return video
+        video = await sora_service.get_video_status(video_id, ttl_ms=STATUS_CACHE_TTL_MS)
+
+        headers = {"ETag": _status_etag(video)}
+        if video.status in ("completed", "failed"):
+            # Terminal states no longer change
+            headers["Cache-Control"] = "public, max-age=3600"
+        else:
+            headers["Cache-Control"] = "no-cache"
 
+        if _etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+            return Response(status_code=304, headers=headers)
+
+        return _model_response(video, headers=headers)
+
+    except VideoNotFoundError:
+        raise
     except Exception as e:
-        logger.error(f"Error fetching video status: {str(e)}", exc_info=True)
-        if "not found" in str(e).lower() or "404" in str(e):
-            raise HTTPException(status_code=404, detail=f"Video {video_id} not found")
+        logger.error("Error fetching video status: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail=f"Failed to fetch video status: {str(e)}")
 
 
 @router.get("/{video_id}/poll", response_model=VideoJob)
-async def poll_video(video_id: str, timeout: int = Query(300, ge=1, le=600)):
+async def poll_video(
+    video_id: str,
+    status_broadcaster: StatusBroadcasterDep,
+    timeout: Annotated[int, Query(ge=1, le=600)] = 300,
+):
     """
     Poll video status until completion or timeout.
 
+    Concurrent pollers of the same video share a single upstream poll.
+
     Args:
         video_id: The video job identifier
         timeout: Maximum seconds to wait (default: 300, max: 600)
@@ -131,24 +217,62 @@ async def poll_video(video_id: str, timeout: int = Query(300, ge=1, le=600)):
         Final VideoJob status (completed or failed)
     """
     try:
-        logger.info(f"Starting poll for video: {video_id}, timeout: {timeout}s")
+        logger.info("Starting poll for video: %s, timeout: %ss", video_id, timeout)
 
-        video = await sora_service.poll_until_complete(video_id, timeout=timeout)
+        video = await status_broadcaster.wait_for_completion(video_id, timeout=timeout)
         return video
 
     except TimeoutError as e:
-        logger.warning(f"Polling timeout for video {video_id}")
+        logger.warning("Polling timeout for video %s", video_id)
         raise HTTPException(status_code=504, detail=str(e))
+    except VideoNotFoundError:
+        raise
     except Exception as e:
-        logger.error(f"Error polling video: {str(e)}", exc_info=True)
-        if "not found" in str(e).lower() or "404" in str(e):
-            raise HTTPException(status_code=404, detail=f"Video {video_id} not found")
+        logger.error("Error polling video: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail=f"Failed to poll video: {str(e)}")
 
 
+@router.get("/{video_id}/events")
+async def stream_video_events(video_id: str, status_broadcaster: StatusBroadcasterDep):
+    """
+    Stream video status updates as server-sent events until completion.
+
+    Each event carries a VideoJob; concurrent subscribers to the same video
+    share a single upstream poll.
+
+    Args:
+        video_id: The video job identifier
+
+    Returns:
+        text/event-stream of status events, ending with the final status
+    """
+    try:
+        logger.info("Opening status stream for video: %s", video_id)
+
+        updates = status_broadcaster.subscribe(video_id)
+
+        # Wait for the first status so API errors are reported before the stream starts
+        first_video = await anext(updates)
+
+        return StreamingResponse(
+            _status_events(first_video, updates),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache"},
+        )
+
+    except VideoNotFoundError:
+        raise
+    except Exception as e:
+        logger.error("Error opening status stream: %s", e, exc_info=True)
+        raise HTTPException(status_code=500, detail=f"Failed to stream video status: {str(e)}")
+
+
 @router.get("/{video_id}/content")
 async def download_video_content(
-    video_id: str, variant: Literal["video", "thumbnail", "spritesheet"] = Query("video")
+    video_id: str,
+    sora_service: SoraServiceDep,
+    storage_service: StorageServiceDep,
+    variant: Annotated[Literal["video", "thumbnail", "spritesheet"], Query()] = "video",
 ):
     """
     Download video content or supporting assets.
@@ -161,7 +285,7 @@ async def download_video_content(
         Binary stream of the requested asset
     """
     try:
-        logger.info(f"Download request for video {video_id}, variant: {variant}")
+        logger.info("Download request for video %s, variant: %s", video_id, variant)
 
         # Check if video is completed first
         video = await sora_service.get_video_status(video_id)
@@ -171,46 +295,55 @@ async def download_video_content(
                 detail=f"Video is not ready for download. Current status: {video.status}",
             )
 
+        content_type = VARIANT_CONTENT_TYPES[variant]
+        filename = video_id + _DOWNLOAD_SUFFIXES[variant]
+
         # Check if we have it cached locally
         local_path = await storage_service.get_video_path(video_id, variant)
+        if local_path is None:
+            # Another request may already be downloading it; reuse its file, or
+            # stream independently if that download is slow to finish
+            local_path = await storage_service.wait_for_pending_save(video_id, variant)
+
+        stat_result = None
+        if local_path is not None:
+            stat_result = await storage_service.stat_for_sendfile(video_id, variant, local_path)
+
+        if stat_result is not None:
+            # Serve from local storage (sendfile where the server supports it)
+            logger.info("Serving %s from local storage: %s", variant, local_path)
+            return FileResponse(local_path, media_type=content_type, filename=filename, stat_result=stat_result)
+
+        # Stream from OpenAI, caching to local storage as chunks pass through
+        logger.info("Streaming %s from OpenAI API", variant)
+        chunks = storage_service.save_stream(
+            video_id, sora_service.stream_video_content(video_id, variant), variant
+        )
 
-        if local_path:
-            # Serve from local storage
-            logger.info(f"Serving {variant} from local storage: {local_path}")
-            with open(local_path, "rb") as f:
-                content = f.read()
-        else:
-            # Download from OpenAI and cache
-            logger.info(f"Downloading {variant} from OpenAI API")
-            content = await sora_service.download_video_content(video_id, variant)
-
-            # Save to local storage
-            await storage_service.save_video(video_id, content, variant)
+        # Pull the first chunk now so API errors are reported before the response starts
+        first_chunk = await anext(chunks, b"")
 
-        # Return as streaming response
-        content_type = storage_service.get_content_type(variant)
         return StreamingResponse(
-            io.BytesIO(content),
+            _prepend_chunk(first_chunk, chunks),
             media_type=content_type,
             headers={
-                "Content-Disposition": f'attachment; filename="{video_id}_{variant}.{variant}"',
+                "Content-Disposition": f'attachment; filename="{filename}"',
             },
         )
 
-    except HTTPException:
+    except (HTTPException, VideoNotFoundError):
         raise
     except Exception as e:
-        logger.error(f"Error downloading video content: {str(e)}", exc_info=True)
-        if "not found" in str(e).lower() or "404" in str(e):
-            raise HTTPException(status_code=404, detail=f"Video {video_id} not found")
+        logger.error("Error downloading video content: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail=f"Failed to download video content: {str(e)}")
 
 
 @router.get("", response_model=VideoListResponse)
 async def list_videos(
-    limit: int = Query(20, ge=1, le=100),
-    after: Optional[str] = Query(None),
-    order: Literal["asc", "desc"] = Query("desc"),
+    sora_service: SoraServiceDep,
+    limit: Annotated[int, Query(ge=1, le=100)] = 20,
+    after: Annotated[Optional[str], Query()] = None,
+    order: Annotated[Literal["asc", "desc"], Query()] = "desc",
 ):
     """
     List video generation jobs with pagination.
@@ -224,19 +357,19 @@ async def list_videos(
         VideoListResponse with list of videos
     """
     try:
-        logger.info(f"Listing videos: limit={limit}, after={after}, order={order}")
+        logger.info("Listing videos: limit=%s, after=%s, order=%s", limit, after, order)
 
         videos, has_more = await sora_service.list_videos(limit=limit, after=after, order=order)
 
-        return VideoListResponse(data=videos, has_more=has_more)
+        return _model_response(VideoListResponse(data=videos, has_more=has_more))
 
     except Exception as e:
-        logger.error(f"Error listing videos: {str(e)}", exc_info=True)
+        logger.error("Error listing videos: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail=f"Failed to list videos: {str(e)}")
 
 
 @router.delete("/{video_id}", response_model=VideoDeleteResponse)
-async def delete_video(video_id: str):
+async def delete_video(video_id: str, sora_service: SoraServiceDep, storage_service: StorageServiceDep):
     """
     Delete a video from OpenAI storage and local cache.
 
@@ -247,26 +380,26 @@ async def delete_video(video_id: str):
         VideoDeleteResponse confirming deletion
     """
     try:
-        logger.info(f"Deleting video: {video_id}")
+        logger.info("Deleting video: %s", video_id)
 
         # Delete from OpenAI
         result = await sora_service.delete_video(video_id)
 
         # Delete local files
         deleted_files = await storage_service.delete_video_files(video_id)
-        logger.info(f"Deleted {deleted_files} local files for video {video_id}")
+        logger.info("Deleted %s local files for video %s", deleted_files, video_id)
 
         return VideoDeleteResponse(**result)
 
+    except VideoNotFoundError:
+        raise
     except Exception as e:
-        logger.error(f"Error deleting video: {str(e)}", exc_info=True)
-        if "not found" in str(e).lower() or "404" in str(e):
-            raise HTTPException(status_code=404, detail=f"Video {video_id} not found")
+        logger.error("Error deleting video: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail=f"Failed to delete video: {str(e)}")
 
 
 @router.post("/{video_id}/remix", response_model=VideoJob, status_code=201)
-async def remix_video(video_id: str, request: RemixVideoRequest):
+async def remix_video(video_id: str, request: RemixVideoRequest, sora_service: SoraServiceDep):
     """
     Create a remix of an existing video with modifications.
 
@@ -278,7 +411,7 @@ async def remix_video(video_id: str, request: RemixVideoRequest):
         VideoJob for the new remix
     """
     try:
-        logger.info(f"Creating remix of video {video_id}")
+        logger.info("Creating remix of video %s", video_id)
 
         # Verify source video is completed
         source_video = await sora_service.get_video_status(video_id)
@@ -293,10 +426,8 @@ async def remix_video(video_id: str, request: RemixVideoRequest):
 
         return remix
 
-    except HTTPException:
+    except (HTTPException, VideoNotFoundError):
         raise
     except Exception as e:
-        logger.error(f"Error creating remix: {str(e)}", exc_info=True)
-        if "not found" in str(e).lower() or "404" in str(e):
-            raise HTTPException(status_code=404, detail=f"Video {video_id} not found")
+        logger.error("Error creating remix: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail=f"Failed to create remix: {str(e)}")
@@ -1,6 +1,8 @@
 """Service modules for business logic."""
 
+from .exceptions import VideoNotFoundError
 from .sora_service import SoraService
 from .storage_service import StorageService
+from .status_broadcaster import VideoStatusBroadcaster
 
-__all__ = ["SoraService", "StorageService"]
+__all__ = ["SoraService", "StorageService", "VideoStatusBroadcaster", "VideoNotFoundError"]
@@ -0,0 +1,15 @@
+"""Exceptions raised by the service layer."""
+
+
+class VideoNotFoundError(Exception):
+    """Raised when the requested video does not exist on the OpenAI side."""
+
+    def __init__(self, video_id: str):
+        """
+        Initialize the error.
+
+        Args:
+            video_id: The video job identifier that was not found
+        """
+        super().__init__(f"Video {video_id} not found")
+        self.video_id = video_id
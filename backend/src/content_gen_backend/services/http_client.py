@@ -0,0 +1,88 @@
+"""Shared HTTP and OpenAI clients for outbound OpenAI API calls."""
+
+import hashlib
+import threading
+from typing import Dict, Optional
+
+import httpx
+from openai import AsyncOpenAI, DefaultAioHttpClient, DefaultAsyncHttpxClient
+from ..utils.logging_setup import logger
+
+# Connection pool shared by every Sora call in this worker process
+HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=30)
+HTTP_TIMEOUT = httpx.Timeout(60, connect=10)
+
+_http_client: Optional[httpx.AsyncClient] = None
+
+# OpenAI clients keyed by a hash of their credentials and endpoint
+_client_cache: Dict[str, AsyncOpenAI] = {}
+_client_lock = threading.Lock()
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Return the process-wide HTTP client, creating it on first use.
+
+    Reusing one pool keeps TLS connections to the API warm across requests.
+    Requests go over aiohttp, whose pool admits queued requests in linear
+    time under heavy fan-out; the httpx transport is used if openai was
+    installed without the aiohttp extra. Creation never awaits, so
+    concurrent callers on the event loop cannot race to build two clients.
+
+    Returns:
+        Shared httpx.AsyncClient
+    """
+    global _http_client
+
+    if _http_client is None or _http_client.is_closed:
+        try:
+            _http_client = DefaultAioHttpClient(limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT)
+            transport = "aiohttp"
+        except RuntimeError:
+            # Raised when the openai aiohttp extra is not installed
+            _http_client = DefaultAsyncHttpxClient(limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT)
+            transport = "httpx"
+        logger.info("Created shared HTTP client for OpenAI API calls (%s transport)", transport)
+    return _http_client
+
+
+def get_openai_client(api_key: str, base_url: Optional[str] = None) -> AsyncOpenAI:
+    """
+    Return a shared AsyncOpenAI client for the given credentials.
+
+    Services created for the same key and endpoint reuse one client (and the
+    shared connection pool) instead of each building their own. The cache is
+    keyed by a SHA-256 digest so API keys are not held as dict keys.
+
+    Args:
+        api_key: OpenAI API key
+        base_url: Optional API base URL override
+
+    Returns:
+        Shared AsyncOpenAI client
+    """
+    key = hashlib.sha256(f"{api_key}|{base_url or ''}".encode("utf-8")).hexdigest()
+
+    with _client_lock:
+        client = _client_cache.get(key)
+        if client is None or client.is_closed():
+            # Retries are handled by the service layer so they get jitter and are not doubled up
+            client = AsyncOpenAI(
+                api_key=api_key, base_url=base_url, http_client=get_http_client(), max_retries=0
+            )
+            _client_cache[key] = client
+        return client
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client and release its pooled connections."""
+    global _http_client
+
+    with _client_lock:
+        # Cached OpenAI clients wrap the pool being closed
+        _client_cache.clear()
+
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+        logger.info("Closed shared HTTP client")
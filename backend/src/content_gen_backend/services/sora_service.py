@@ -1,19 +1,129 @@
 """Sora API service wrapper for video generation."""
 
 import asyncio
-from typing import Optional, List, Literal
-from openai import AsyncOpenAI, OpenAIError
-from ..config import settings
+import logging
+import random
+import time
+import orjson
+from cachetools import TTLCache
+from contextlib import nullcontext
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Optional, List, Literal, TypeVar, Union
+from openai import (
+    APIConnectionError,
+    APITimeoutError,
+    InternalServerError,
+    NotFoundError,
+    OpenAIError,
+    RateLimitError,
+)
+from openai.types import Batch, Video
+from .exceptions import VideoNotFoundError
+from .http_client import get_openai_client
 from ..models.video_response import VideoJob, ErrorDetail
 from ..utils.logging_setup import logger
 
+T = TypeVar("T")
+
+# Errors worth retrying: the same request may succeed a moment later
+TRANSIENT_ERRORS = (RateLimitError, APITimeoutError, APIConnectionError, InternalServerError)
+
+# Aim for roughly this many polls over a job's estimated remaining time
+POLLS_PER_ETA = 4
+
+
+def _full_jitter(base: float, attempt: int, cap: float) -> float:
+    """Full-jitter backoff delay: uniform between zero and the capped exponential."""
+    return random.uniform(0, min(cap, base * 2**attempt))
+
+
+async def _retry(
+    request: Callable[[], Awaitable[T]], max_attempts: int = 3, base: float = 1.0, cap: float = 30.0
+) -> T:
+    """
+    Run an API request, retrying transient errors with jittered exponential backoff.
+
+    Args:
+        request: Factory returning a fresh awaitable for each attempt
+        max_attempts: Maximum number of attempts
+        base: Backoff base delay in seconds
+        cap: Maximum backoff delay in seconds
+
+    Returns:
+        Result of the first successful attempt
+
+    Raises:
+        OpenAIError: If the error is not transient or all attempts fail
+    """
+    for attempt in range(max_attempts):
+        try:
+            return await request()
+        except TRANSIENT_ERRORS as e:
+            if attempt == max_attempts - 1:
+                raise
+            # Jitter keeps many clients from retrying in lockstep
+            delay = min(cap, base * 2**attempt) + random.uniform(0, base)
+            logger.warning("Transient OpenAI API error (%s), retrying in %.1fs", type(e).__name__, delay)
+            await asyncio.sleep(delay)
+
+
+def _to_video_job(video) -> VideoJob:
+    """
+    Convert OpenAI video object to our VideoJob model.
+
+    The SDK has already validated the object, so the models are built with
+    model_construct to skip a second round of Pydantic validation.
+
+    Args:
+        video: OpenAI video object
+
+    Returns:
+        VideoJob instance
+    """
+    # Pydantic keeps field values in __dict__; reading it directly is cheaper
+    # than a getattr per field and much cheaper than model_dump()
+    fields = vars(video)
+
+    error_detail = None
+    error = fields.get("error")
+    if error:
+        error_detail = ErrorDetail.model_construct(
+            message=getattr(error, "message", "Unknown error"),
+            type=getattr(error, "type", "unknown"),
+        )
+
+    seconds = fields.get("seconds")
+    return VideoJob.model_construct(
+        id=fields["id"],
+        object=fields.get("object", "video"),
+        status=fields["status"],
+        model=fields["model"],
+        progress=fields.get("progress"),
+        created_at=fields["created_at"],
+        completed_at=fields.get("completed_at"),
+        expires_at=fields.get("expires_at"),
+        size=fields["size"],
+        seconds=str(seconds) if seconds is not None else "4",
+        remixed_from_video_id=fields.get("remixed_from_video_id"),
+        error=error_detail,
+    )
+
 
 class SoraService:
     """Service class for interacting with OpenAI's Sora API."""
 
-    def __init__(self):
-        """Initialize the Sora service with OpenAI client."""
-        self.client = AsyncOpenAI(api_key=settings.openai_api_key)
+    def __init__(self, api_key: str):
+        """
+        Initialize the Sora service.
+
+        Args:
+            api_key: OpenAI API key
+        """
+        # Services are built per application lifespan, so the client cannot
+        # outlive the shared pool that close_http_client shuts down
+        self.client = get_openai_client(api_key)
+        # Last fetched in-progress status per video, as (fetched_at, VideoJob)
+        self._status_cache: TTLCache = TTLCache(maxsize=1024, ttl=60)
+        self._status_locks: Dict[str, asyncio.Lock] = {}
         logger.info("SoraService initialized")
 
     async def create_video(
@@ -22,7 +132,7 @@ class SoraService:
         model: str = "sora-2",
         seconds: int = 4,
         size: str = "1280x720",
-        input_reference: Optional[bytes] = None,
+        input_reference: Optional[Any] = None,
     ) -> VideoJob:
         """
         Create a new video generation job.
@@ -32,7 +142,8 @@ class SoraService:
             model: Model to use (sora-2 or sora-2-pro)
             seconds: Duration in seconds
             size: Resolution as widthxheight
-            input_reference: Optional reference image bytes
+            input_reference: Optional reference image as bytes, a file object,
+                or a (filename, file, content_type) tuple
 
         Returns:
             VideoJob with initial status
@@ -41,7 +152,7 @@ class SoraService:
             OpenAIError: If API call fails
         """
         try:
-            logger.info(f"Creating video with prompt: '{prompt[:50]}...', model: {model}, seconds: {seconds}, size: {size}")
+            logger.info("Creating video with prompt: '%.50s...', model: %s, seconds: %s, size: %s", prompt, model, seconds, size)
 
             # Build request parameters
             params = {
@@ -56,25 +167,218 @@ class SoraService:
                 params["input_reference"] = input_reference
                 logger.info("Input reference image included")
 
+            def create_request():
+                # Rewind an uploaded file so a retried request sends it in full
+                file = input_reference[1] if isinstance(input_reference, tuple) else input_reference
+                if hasattr(file, "seek"):
+                    file.seek(0)
+                return self.client.videos.create(**params)
+
             # Call OpenAI API
-            video = await self.client.videos.create(**params)
+            video = await _retry(create_request)
 
-            logger.info(f"Video creation started: {video.id}, status: {video.status}")
+            logger.info("Video creation started: %s, status: %s", video.id, video.status)
 
             # Convert to our model
-            return self._convert_to_video_job(video)
+            return _to_video_job(video)
+
+        except OpenAIError as e:
+            logger.error("OpenAI API error during video creation: %s", e, exc_info=True)
+            raise
+        except Exception as e:
+            logger.error("Unexpected error during video creation: %s", e, exc_info=True)
+            raise
+
+    async def create_videos_batch(self, jobs: List[Dict[str, Any]]) -> str:
+        """
+        Submit many video generation jobs as a single Batch API request.
+
+        Batched jobs are billed at the batch discount and complete within a
+        24 hour window, so this suits bulk generation that is not waiting on
+        the result.
+
+        Args:
+            jobs: Job specs with a prompt and optional model, seconds, size
+                and custom_id (defaults to the job's index)
+
+        Returns:
+            Batch identifier to pass to wait_for_batch
+
+        Raises:
+            OpenAIError: If API call fails
+        """
+        try:
+            logger.info("Creating video batch with %s jobs", len(jobs))
+
+            # One JSONL request line per job
+            lines = []
+            for index, job in enumerate(jobs):
+                body = {
+                    "model": job.get("model", "sora-2"),
+                    "prompt": job["prompt"],
+                    "seconds": str(job.get("seconds", 4)),
+                    "size": job.get("size", "1280x720"),
+                }
+                lines.append(
+                    orjson.dumps(
+                        {
+                            "custom_id": str(job.get("custom_id", index)),
+                            "method": "POST",
+                            "url": "/v1/videos",
+                            "body": body,
+                        }
+                    )
+                )
+
+            batch_file = await _retry(
+                lambda: self.client.files.create(
+                    file=("videos_batch.jsonl", b"\n".join(lines)), purpose="batch"
+                )
+            )
+            batch = await _retry(
+                lambda: self.client.batches.create(
+                    input_file_id=batch_file.id, endpoint="/v1/videos", completion_window="24h"
+                )
+            )
+
+            logger.info("Video batch created: %s, status: %s", batch.id, batch.status)
+            return batch.id
 
         except OpenAIError as e:
-            logger.error(f"OpenAI API error during video creation: {str(e)}", exc_info=True)
+            logger.error("OpenAI API error during batch creation: %s", e, exc_info=True)
             raise
         except Exception as e:
-            logger.error(f"Unexpected error during video creation: {str(e)}", exc_info=True)
+            logger.error("Unexpected error during batch creation: %s", e, exc_info=True)
             raise
 
-    async def get_video_status(self, video_id: str) -> VideoJob:
+    async def wait_for_batch(
+        self, batch_id: str, poll_interval: int = 30, timeout: int = 24 * 60 * 60
+    ) -> Dict[str, VideoJob]:
+        """
+        Wait for a video batch to finish and return the jobs it created.
+
+        Args:
+            batch_id: Batch identifier from create_videos_batch
+            poll_interval: Seconds between batch status checks
+            timeout: Maximum seconds to wait
+
+        Returns:
+            VideoJob for each successfully created job, keyed by custom_id
+
+        Raises:
+            TimeoutError: If timeout is reached
+            OpenAIError: If API call fails
+        """
+        logger.info("Waiting for video batch %s, timeout: %ss", batch_id, timeout)
+
+        start_time = time.monotonic()
+
+        while True:
+            batch = await _retry(lambda: self.client.batches.retrieve(batch_id))
+            if batch.status in ("completed", "failed", "expired", "cancelled"):
+                break
+
+            elapsed = time.monotonic() - start_time
+            if elapsed > timeout:
+                logger.warning("Batch wait timeout reached for %s after %.1fs", batch_id, elapsed)
+                raise TimeoutError(f"Batch wait timeout after {timeout} seconds")
+
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Batch %s status: %s", batch_id, batch.status)
+            await asyncio.sleep(poll_interval)
+
+        if batch.status != "completed":
+            logger.warning("Batch %s finished with status: %s", batch_id, batch.status)
+
+        return await self._read_batch_output(batch)
+
+    async def _read_batch_output(self, batch: Batch) -> Dict[str, VideoJob]:
+        """
+        Parse the output file of a finished batch.
+
+        Args:
+            batch: Finished OpenAI batch object
+
+        Returns:
+            VideoJob for each successful request line, keyed by custom_id
+        """
+        if not batch.output_file_id:
+            return {}
+
+        content = await _retry(lambda: self.client.files.content(batch.output_file_id))
+
+        jobs = {}
+        for line in content.content.splitlines():
+            if not line:
+                continue
+            result = orjson.loads(line)
+            response = result.get("response") or {}
+            if response.get("status_code") != 200:
+                error = result.get("error") or response.get("body")
+                logger.warning("Batch request %s failed: %s", result.get("custom_id"), error)
+                continue
+            jobs[result["custom_id"]] = _to_video_job(Video.model_validate(response["body"]))
+
+        logger.info("Batch %s created %s videos", batch.id, len(jobs))
+        return jobs
+
+    async def get_video_status(self, video_id: str, ttl_ms: int = 0) -> VideoJob:
         """
         Retrieve the current status of a video generation job.
 
+        With a TTL, a status fetched within the last ttl_ms milliseconds is
+        reused and concurrent misses for the same video share one request.
+        Completed and failed statuses are never cached.
+
+        Args:
+            video_id: The video job identifier
+            ttl_ms: Maximum age in milliseconds of a cached status to reuse
+                (0 always fetches; capped at the cache's 60 second lifetime)
+
+        Returns:
+            VideoJob with current status
+
+        Raises:
+            VideoNotFoundError: If the video does not exist
+            OpenAIError: If API call fails
+        """
+        if ttl_ms <= 0:
+            return await self._fetch_video_status(video_id)
+
+        cached = self._cached_status(video_id, ttl_ms)
+        if cached is not None:
+            return cached
+
+        lock = self._status_locks.setdefault(video_id, asyncio.Lock())
+        try:
+            async with lock:
+                # Another caller may have refreshed the entry while we waited
+                cached = self._cached_status(video_id, ttl_ms)
+                if cached is not None:
+                    return cached
+
+                video = await self._fetch_video_status(video_id)
+                if video.status in ("completed", "failed"):
+                    self._status_cache.pop(video_id, None)
+                else:
+                    # Stamp after the request so the TTL counts from fresh data
+                    self._status_cache[video_id] = (time.monotonic(), video)
+                return video
+        finally:
+            if not lock.locked():
+                self._status_locks.pop(video_id, None)
+
+    def _cached_status(self, video_id: str, ttl_ms: int) -> Optional[VideoJob]:
+        """Return the cached status for a video if it is younger than ttl_ms."""
+        entry = self._status_cache.get(video_id)
+        if entry is not None and (time.monotonic() - entry[0]) * 1000 < ttl_ms:
+            return entry[1]
+        return None
+
+    async def _fetch_video_status(self, video_id: str) -> VideoJob:
+        """
+        Fetch the current status of a video from the API.
+
         Args:
             video_id: The video job identifier
 
@@ -82,70 +386,158 @@ class SoraService:
             VideoJob with current status
 
         Raises:
+            VideoNotFoundError: If the video does not exist
             OpenAIError: If API call fails
         """
         try:
-            logger.debug(f"Fetching status for video: {video_id}")
+            debug = logger.isEnabledFor(logging.DEBUG)
+            if debug:
+                logger.debug("Fetching status for video: %s", video_id)
 
-            video = await self.client.videos.retrieve(video_id)
+            video = await _retry(lambda: self.client.videos.retrieve(video_id))
 
-            logger.debug(f"Video {video_id} status: {video.status}, progress: {getattr(video, 'progress', 'N/A')}")
+            if debug:
+                logger.debug(
+                    "Video %s status: %s, progress: %s", video_id, video.status, getattr(video, "progress", "N/A")
+                )
 
-            return self._convert_to_video_job(video)
+            return _to_video_job(video)
 
+        except NotFoundError as e:
+            logger.warning("Video %s not found", video_id)
+            raise VideoNotFoundError(video_id) from e
         except OpenAIError as e:
-            logger.error(f"OpenAI API error fetching video status for {video_id}: {str(e)}", exc_info=True)
+            logger.error("OpenAI API error fetching video status for %s: %s", video_id, e, exc_info=True)
             raise
         except Exception as e:
-            logger.error(f"Unexpected error fetching video status for {video_id}: {str(e)}", exc_info=True)
+            logger.error("Unexpected error fetching video status for %s: %s", video_id, e, exc_info=True)
             raise
 
     async def poll_until_complete(
-        self, video_id: str, timeout: int = 300, poll_interval: int = 2
+        self,
+        video_id: str,
+        timeout: int = 300,
+        poll_interval: int = 2,
+        on_update: Optional[Callable[[VideoJob], None]] = None,
+        semaphore: Optional[asyncio.Semaphore] = None,
     ) -> VideoJob:
         """
         Poll video status until completion or failure with exponential backoff.
 
+        Delays use full jitter so concurrent pollers do not fire in lockstep,
+        and restart from poll_interval whenever the status changes. Once the
+        job reports progress, the delay is stretched toward the estimated
+        time remaining so long jobs are not over-polled.
+
         Args:
             video_id: The video job identifier
             timeout: Maximum seconds to wait
             poll_interval: Initial polling interval in seconds
+            on_update: Optional callback invoked with every fetched status
+            semaphore: Optional semaphore bounding concurrent status requests
 
         Returns:
             Final VideoJob status
 
         Raises:
             TimeoutError: If timeout is reached
-            OpenAIError: If API call fails
+            OpenAIError: If API call fails with a non-transient error
         """
-        logger.info(f"Starting polling for video {video_id}, timeout: {timeout}s")
+        logger.info("Starting polling for video %s, timeout: %ss", video_id, timeout)
 
-        start_time = asyncio.get_event_loop().time()
-        current_interval = poll_interval
+        start_time = time.monotonic()
         max_interval = 10
+        attempt = 0
+        last_status = None
+        first_progress = None  # (timestamp, progress) of the first progress report
 
         while True:
-            elapsed = asyncio.get_event_loop().time() - start_time
+            elapsed = time.monotonic() - start_time
 
             if elapsed > timeout:
-                logger.warning(f"Polling timeout reached for video {video_id} after {elapsed:.1f}s")
+                logger.warning("Polling timeout reached for video %s after %.1fs", video_id, elapsed)
                 raise TimeoutError(f"Polling timeout after {timeout} seconds")
 
-            video = await self.get_video_status(video_id)
+            try:
+                async with semaphore or nullcontext():
+                    video = await self.get_video_status(video_id)
+            except TRANSIENT_ERRORS as e:
+                # Keep polling through upstream hiccups, backing off further each time
+                delay = _full_jitter(poll_interval, attempt, max_interval)
+                logger.warning("Transient error polling video %s, retrying in %.1fs: %s", video_id, delay, e)
+                await asyncio.sleep(delay)
+                attempt += 1
+                continue
+
+            if on_update is not None:
+                on_update(video)
 
             if video.status in ["completed", "failed"]:
-                logger.info(f"Video {video_id} finished with status: {video.status}")
+                logger.info("Video %s finished with status: %s", video_id, video.status)
                 return video
 
-            # Exponential backoff
-            await asyncio.sleep(current_interval)
-            current_interval = min(current_interval * 2, max_interval)
+            if video.status != last_status:
+                # Something changed; check back soon
+                last_status = video.status
+                attempt = 0
+
+            delay = _full_jitter(poll_interval, attempt, max_interval)
+
+            if video.progress:
+                now = time.monotonic()
+                if first_progress is None:
+                    first_progress = (now, video.progress)
+                elif video.progress > first_progress[1] and now > first_progress[0]:
+                    # Estimate time remaining from the progress rate seen so far
+                    rate = (video.progress - first_progress[1]) / (now - first_progress[0])
+                    eta = (100 - video.progress) / rate
+                    delay = max(delay, min(max_interval, eta / POLLS_PER_ETA))
+
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def poll_many(
+        self,
+        video_ids: List[str],
+        concurrency: int = 10,
+        timeout: int = 300,
+        poll_interval: int = 2,
+    ) -> List[Union[VideoJob, BaseException]]:
+        """
+        Poll several videos concurrently until each completes or fails.
+
+        Every video keeps its own backoff schedule; the semaphore only caps
+        how many status requests are in flight at once.
+
+        Args:
+            video_ids: Video job identifiers
+            concurrency: Maximum concurrent status requests
+            timeout: Maximum seconds to wait for each video
+            poll_interval: Initial polling interval in seconds
+
+        Returns:
+            Final VideoJob, or the exception raised while polling, for each
+            video in the same order as video_ids
+        """
+        logger.info("Polling %s videos, concurrency: %s", len(video_ids), concurrency)
+
+        semaphore = asyncio.Semaphore(concurrency)
+        return await asyncio.gather(
+            *(
+                self.poll_until_complete(video_id, timeout, poll_interval, semaphore=semaphore)
+                for video_id in video_ids
+            ),
+            return_exceptions=True,
+        )
 
     async def download_video_content(
         self, video_id: str, variant: Literal["video", "thumbnail", "spritesheet"] = "video"
     ) -> bytes:
         """
-        Download video content or supporting assets.
+        Download video content or supporting assets into memory.
+
+        Intended for small assets such as thumbnails; use stream_video_content
+        for full videos.
 
         Args:
             video_id: The video job identifier
@@ -155,12 +547,13 @@ class SoraService:
             Binary content of the asset
 
         Raises:
+            VideoNotFoundError: If the video does not exist
             OpenAIError: If API call fails
         """
         try:
-            logger.info(f"Downloading {variant} for video {video_id}")
+            logger.info("Downloading %s for video %s", variant, video_id)
 
-            content = await self.client.videos.download_content(video_id, variant=variant)
+            content = await _retry(lambda: self.client.videos.download_content(video_id, variant=variant))
 
             # Read the content
             if hasattr(content, "read"):
@@ -171,14 +564,68 @@ class SoraService:
                 # Assume it's already bytes
                 data = bytes(content)
 
-            logger.info(f"Downloaded {len(data)} bytes of {variant} for video {video_id}")
+            logger.info("Downloaded %s bytes of %s for video %s", len(data), variant, video_id)
             return data
 
+        except NotFoundError as e:
+            logger.warning("Video %s not found", video_id)
+            raise VideoNotFoundError(video_id) from e
         except OpenAIError as e:
-            logger.error(f"OpenAI API error downloading {variant} for {video_id}: {str(e)}", exc_info=True)
+            logger.error("OpenAI API error downloading %s for %s: %s", variant, video_id, e, exc_info=True)
             raise
         except Exception as e:
-            logger.error(f"Unexpected error downloading {variant} for {video_id}: {str(e)}", exc_info=True)
+            logger.error("Unexpected error downloading %s for %s: %s", variant, video_id, e, exc_info=True)
+            raise
+
+    async def stream_video_content(
+        self,
+        video_id: str,
+        variant: Literal["video", "thumbnail", "spritesheet"] = "video",
+        chunk_size: int = 1024 * 1024,
+    ) -> AsyncIterator[bytes]:
+        """
+        Stream video content or supporting assets without buffering the whole file.
+
+        Args:
+            video_id: The video job identifier
+            variant: Type of asset to download
+            chunk_size: Size of each yielded chunk in bytes
+
+        Yields:
+            Chunks of the asset's binary content
+
+        Raises:
+            VideoNotFoundError: If the video does not exist
+            OpenAIError: If API call fails
+        """
+        try:
+            logger.info("Streaming %s for video %s", variant, video_id)
+
+            total = 0
+            # Only opening the stream is retried; a failure mid-body propagates
+            response = await _retry(
+                lambda: self.client.videos.with_streaming_response.download_content(
+                    video_id, variant=variant
+                ).__aenter__()
+            )
+            try:
+                async for chunk in response.iter_bytes(chunk_size):
+                    total += len(chunk)
+                    yield chunk
+            finally:
+                # Return the connection to the pool even if the consumer stops early
+                await response.close()
+
+            logger.info("Streamed %s bytes of %s for video %s", total, variant, video_id)
+
+        except NotFoundError as e:
+            logger.warning("Video %s not found", video_id)
+            raise VideoNotFoundError(video_id) from e
+        except OpenAIError as e:
+            logger.error("OpenAI API error streaming %s for %s: %s", variant, video_id, e, exc_info=True)
+            raise
+        except Exception as e:
+            logger.error("Unexpected error streaming %s for %s: %s", variant, video_id, e, exc_info=True)
             raise
 
     async def list_videos(
@@ -202,26 +649,26 @@ class SoraService:
             OpenAIError: If API call fails
         """
         try:
-            logger.info(f"Listing videos: limit={limit}, after={after}, order={order}")
+            logger.info("Listing videos: limit=%s, after=%s, order=%s", limit, after, order)
 
             params = {"limit": limit, "order": order}
             if after:
                 params["after"] = after
 
-            page = await self.client.videos.list(**params)
+            page = await _retry(lambda: self.client.videos.list(**params))
 
-            videos = [self._convert_to_video_job(v) for v in page.data]
+            videos = list(map(_to_video_job, page.data))
             has_more = getattr(page, "has_more", False)
 
-            logger.info(f"Retrieved {len(videos)} videos, has_more: {has_more}")
+            logger.info("Retrieved %s videos, has_more: %s", len(videos), has_more)
 
             return videos, has_more
 
         except OpenAIError as e:
-            logger.error(f"OpenAI API error listing videos: {str(e)}", exc_info=True)
+            logger.error("OpenAI API error listing videos: %s", e, exc_info=True)
             raise
         except Exception as e:
-            logger.error(f"Unexpected error listing videos: {str(e)}", exc_info=True)
+            logger.error("Unexpected error listing videos: %s", e, exc_info=True)
             raise
 
     async def delete_video(self, video_id: str) -> dict:
@@ -235,22 +682,26 @@ class SoraService:
             Deletion confirmation dict
 
         Raises:
+            VideoNotFoundError: If the video does not exist
             OpenAIError: If API call fails
         """
         try:
-            logger.info(f"Deleting video {video_id}")
+            logger.info("Deleting video %s", video_id)
 
-            result = await self.client.videos.delete(video_id)
+            result = await _retry(lambda: self.client.videos.delete(video_id))
 
-            logger.info(f"Video {video_id} deleted successfully")
+            logger.info("Video %s deleted successfully", video_id)
 
             return {"id": video_id, "object": "video", "deleted": True}
 
+        except NotFoundError as e:
+            logger.warning("Video %s not found", video_id)
+            raise VideoNotFoundError(video_id) from e
         except OpenAIError as e:
-            logger.error(f"OpenAI API error deleting video {video_id}: {str(e)}", exc_info=True)
+            logger.error("OpenAI API error deleting video %s: %s", video_id, e, exc_info=True)
             raise
         except Exception as e:
-            logger.error(f"Unexpected error deleting video {video_id}: {str(e)}", exc_info=True)
+            logger.error("Unexpected error deleting video %s: %s", video_id, e, exc_info=True)
             raise
 
     async def remix_video(self, video_id: str, prompt: str) -> VideoJob:
@@ -265,52 +716,24 @@ class SoraService:
             VideoJob for the new remix
 
         Raises:
+            VideoNotFoundError: If the video does not exist
             OpenAIError: If API call fails
         """
         try:
-            logger.info(f"Creating remix of video {video_id} with prompt: '{prompt[:50]}...'")
+            logger.info("Creating remix of video %s with prompt: '%.50s...'", video_id, prompt)
 
-            video = await self.client.videos.remix(video_id=video_id, prompt=prompt)
+            video = await _retry(lambda: self.client.videos.remix(video_id=video_id, prompt=prompt))
 
-            logger.info(f"Remix created: {video.id}, remixed from: {video_id}")
+            logger.info("Remix created: %s, remixed from: %s", video.id, video_id)
 
-            return self._convert_to_video_job(video)
+            return _to_video_job(video)
 
+        except NotFoundError as e:
+            logger.warning("Video %s not found", video_id)
+            raise VideoNotFoundError(video_id) from e
         except OpenAIError as e:
-            logger.error(f"OpenAI API error remixing video {video_id}: {str(e)}", exc_info=True)
+            logger.error("OpenAI API error remixing video %s: %s", video_id, e, exc_info=True)
             raise
         except Exception as e:
-            logger.error(f"Unexpected error remixing video {video_id}: {str(e)}", exc_info=True)
+            logger.error("Unexpected error remixing video %s: %s", video_id, e, exc_info=True)
             raise
-
-    def _convert_to_video_job(self, video) -> VideoJob:
-        """
-        Convert OpenAI video object to our VideoJob model.
-
-        Args:
-            video: OpenAI video object
-
-        Returns:
-            VideoJob instance
-        """
-        error_detail = None
-        if hasattr(video, "error") and video.error:
-            error_detail = ErrorDetail(
-                message=getattr(video.error, "message", "Unknown error"),
-                type=getattr(video.error, "type", "unknown"),
-            )
-
-        return VideoJob(
-            id=video.id,
-            object=getattr(video, "object", "video"),
-            status=video.status,
-            model=video.model,
-            progress=getattr(video, "progress", None),
-            created_at=video.created_at,
-            completed_at=getattr(video, "completed_at", None),
-            expires_at=getattr(video, "expires_at", None),
-            size=video.size,
-            seconds=str(video.seconds) if hasattr(video, "seconds") else "4",
-            remixed_from_video_id=getattr(video, "remixed_from_video_id", None),
-            error=error_detail,
-        )
@@ -0,0 +1,135 @@
+"""Shared status polling for video jobs with fan-out to concurrent watchers."""
+
+import asyncio
+from typing import AsyncIterator, Dict, Optional
+from ..models.video_response import VideoJob
+from ..utils.logging_setup import logger
+from .sora_service import SoraService
+
+
+class _VideoWatch:
+    """Latest known status of a single video and the event its subscribers wait on."""
+
+    def __init__(self):
+        self.latest: Optional[VideoJob] = None
+        self.error: Optional[Exception] = None
+        self.changed = asyncio.Event()
+        self.subscribers = 0
+        self.task: Optional[asyncio.Task] = None
+
+    def publish(self, video: Optional[VideoJob] = None, error: Optional[Exception] = None) -> None:
+        """Store a new status (or error) and wake every waiting subscriber."""
+        if video is not None and video == self.latest:
+            return
+        if video is not None:
+            self.latest = video
+        if error is not None:
+            self.error = error
+        self.changed.set()
+        self.changed = asyncio.Event()
+
+
+class VideoStatusBroadcaster:
+    """Service that runs one upstream poll per video and fans updates out to subscribers."""
+
+    def __init__(self, sora_service: SoraService, poll_timeout: int):
+        """
+        Initialize the broadcaster.
+
+        Args:
+            sora_service: Service used to poll the Sora API
+            poll_timeout: Maximum seconds a shared upstream poll may run
+        """
+        self.sora_service = sora_service
+        self.poll_timeout = poll_timeout
+        self._watches: Dict[str, _VideoWatch] = {}
+        logger.info("VideoStatusBroadcaster initialized")
+
+    async def subscribe(self, video_id: str) -> AsyncIterator[VideoJob]:
+        """
+        Yield status updates for a video until it completes or fails.
+
+        Concurrent subscribers to the same video share a single upstream poll.
+
+        Args:
+            video_id: The video job identifier
+
+        Yields:
+            VideoJob for each observed status change, ending with the final status
+
+        Raises:
+            TimeoutError: If the shared poll exceeds the configured timeout
+            OpenAIError: If polling the API fails
+        """
+        watch = self._watches.get(video_id)
+        if watch is None:
+            watch = _VideoWatch()
+            watch.task = asyncio.create_task(self._poll(video_id, watch))
+            self._watches[video_id] = watch
+            logger.info("Started shared status poll for video %s", video_id)
+
+        watch.subscribers += 1
+        try:
+            last_sent = None
+            while True:
+                changed = watch.changed
+                if watch.latest is not None and watch.latest is not last_sent:
+                    last_sent = watch.latest
+                    yield last_sent
+                    if last_sent.status in ("completed", "failed"):
+                        return
+                elif watch.error is not None:
+                    raise watch.error
+                else:
+                    await changed.wait()
+        finally:
+            watch.subscribers -= 1
+            if watch.subscribers == 0 and not watch.task.done():
+                logger.info("No subscribers left, stopping status poll for video %s", video_id)
+                watch.task.cancel()
+                self._forget(video_id, watch)
+
+    async def wait_for_completion(self, video_id: str, timeout: int = 300) -> VideoJob:
+        """
+        Wait for a video to complete or fail using the shared poll.
+
+        Args:
+            video_id: The video job identifier
+            timeout: Maximum seconds to wait
+
+        Returns:
+            Final VideoJob status
+
+        Raises:
+            TimeoutError: If timeout is reached
+            OpenAIError: If polling the API fails
+        """
+        video = None
+        try:
+            async with asyncio.timeout(timeout):
+                async for video in self.subscribe(video_id):
+                    pass
+        except TimeoutError:
+            raise TimeoutError(f"Polling timeout after {timeout} seconds") from None
+
+        return video
+
+    async def _poll(self, video_id: str, watch: _VideoWatch) -> None:
+        """Poll the API for one video, publishing every status to its subscribers."""
+        try:
+            await self.sora_service.poll_until_complete(
+                video_id,
+                timeout=self.poll_timeout,
+                on_update=lambda video: watch.publish(video=video),
+            )
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            watch.publish(error=e)
+        finally:
+            self._forget(video_id, watch)
+
+    def _forget(self, video_id: str, watch: _VideoWatch) -> None:
+        """Drop a finished watch so the next subscriber starts a fresh poll."""
+        if self._watches.get(video_id) is watch:
+            del self._watches[video_id]
@@ -1,64 +1,265 @@
 """Storage service for managing downloaded video files."""
 
-import aiofiles
+import asyncio
+import hashlib
+import logging
+import os
+import time
+import uuid
+from cachetools import TTLCache
 from pathlib import Path
-from typing import Optional, Literal
-from ..config import settings
+from types import MappingProxyType
+from typing import AsyncIterator, Dict, Optional, Literal
 from ..utils.logging_setup import logger
 
+_VARIANTS = ("video", "thumbnail", "spritesheet")
+
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+# Content-addressed store entries newer than this are never collected, so a
+# save that has just added its entry can still link to it
+CAS_GC_MIN_AGE = 60
+# How often unreferenced store entries are reclaimed while the app runs
+CAS_GC_INTERVAL = 300
+
+# How long a request waits for another request's save before downloading the
+# asset itself; that save only advances as fast as its own client reads
+PENDING_SAVE_TIMEOUT = 10
+
+# File extension and MIME type per asset variant (read-only, shared by all callers)
+VARIANT_EXTENSIONS = MappingProxyType({
+    "video": ".mp4",
+    "thumbnail": ".webp",
+    "spritesheet": ".jpg",
+})
+
+VARIANT_CONTENT_TYPES = MappingProxyType({
+    "video": "video/mp4",
+    "thumbnail": "image/webp",
+    "spritesheet": "image/jpeg",
+})
+
+
+def _write_chunk(fd: int, chunk: bytes, digest) -> None:
+    """Write a chunk with raw os.write calls and add it to the hash (run in a worker thread)."""
+    view = memoryview(chunk)
+    while view:
+        written = os.write(fd, view)
+        view = view[written:]
+    digest.update(chunk)
+
+
+def _link_from_cas(cas_path: str, filepath: str) -> bool:
+    """
+    Point filepath at an existing content-addressed entry.
+
+    The link is made under a temporary name and renamed over filepath, so the
+    swap is atomic and other links to the old content are left untouched.
+
+    Returns:
+        False if the entry does not exist
+    """
+    temp_path = f"{filepath}.{uuid.uuid4().hex}.link"
+    try:
+        os.link(cas_path, temp_path)
+    except FileNotFoundError:
+        return False
+    os.replace(temp_path, filepath)
+    return True
+
+
+def _commit_partial(partial_path: str, cas_path: str, filepath: str) -> bool:
+    """
+    Add a fully written temporary file to the store and move it to filepath.
+
+    On a filesystem without hard links the file is moved into place as a
+    plain, unshared file.
+
+    Returns:
+        True if identical content was already stored and the new copy dropped
+    """
+    try:
+        if _link_from_cas(cas_path, filepath):
+            os.unlink(partial_path)
+            return True
+
+        os.makedirs(os.path.dirname(cas_path), exist_ok=True)
+        os.link(partial_path, cas_path)
+    except FileExistsError:
+        # Another save stored the same content first; keep this copy as is
+        pass
+    except OSError as e:
+        logger.warning("Could not add %s to content store, saving without deduplication: %s", filepath, e)
+
+    os.replace(partial_path, filepath)
+    return False
+
+
+def _collect_cas_garbage(cas_root: str, min_age: float) -> int:
+    """Unlink store entries that no saved file links to any more."""
+    cutoff = time.time() - min_age
+    removed = 0
+    try:
+        shards = list(os.scandir(cas_root))
+    except FileNotFoundError:
+        return 0
+
+    for shard in shards:
+        if not shard.is_dir(follow_symlinks=False):
+            continue
+        try:
+            entries = list(os.scandir(shard.path))
+        except FileNotFoundError:
+            continue
+        for entry in entries:
+            try:
+                st = entry.stat(follow_symlinks=False)
+            except FileNotFoundError:
+                continue
+            if st.st_nlink == 1 and st.st_mtime < cutoff and _unlink_if_exists(entry.path):
+                removed += 1
+    return removed
+
+
+def _unlink_if_exists(path: str) -> bool:
+    """Delete a file, returning False if it was already gone."""
+    try:
+        os.unlink(path)
+        return True
+    except FileNotFoundError:
+        return False
+
 
 class StorageService:
     """Service for local file storage operations."""
 
-    def __init__(self, storage_path: Optional[str] = None):
+    def __init__(self, storage_path: str):
         """
         Initialize storage service.
 
         Args:
             storage_path: Path to video storage directory
         """
-        self.storage_path = Path(storage_path or settings.video_storage_path)
+        self.storage_path = Path(storage_path)
         self.storage_path.mkdir(parents=True, exist_ok=True)
-        logger.info(f"StorageService initialized with path: {self.storage_path.absolute()}")
+        # String form for os.path.join on hot lookups
+        self._storage_path_str = str(self.storage_path)
+        # Content-addressed store; saved files are hard links into it
+        self._cas_path_str = os.path.join(self._storage_path_str, "cas")
+        os.makedirs(self._cas_path_str, exist_ok=True)
+        # Recently resolved file paths, keyed by (video_id, variant)
+        self._path_cache: TTLCache = TTLCache(maxsize=1024, ttl=60)
+        # Saves in progress, resolved with the final path (or None on failure)
+        self._pending_saves: Dict[tuple[str, str], asyncio.Future] = {}
+        logger.info("StorageService initialized with path: %s", self.storage_path.absolute())
 
-    async def save_video(
-        self, video_id: str, content: bytes, variant: Literal["video", "thumbnail", "spritesheet"] = "video"
-    ) -> Path:
+    async def save_stream(
+        self,
+        video_id: str,
+        chunks: AsyncIterator[bytes],
+        variant: Literal["video", "thumbnail", "spritesheet"] = "video",
+    ) -> AsyncIterator[bytes]:
         """
-        Save video content to local storage.
+        Save streamed content to local storage while passing each chunk through.
+
+        Chunks are written to a temporary file that is only moved into place once
+        the stream completes, so an interrupted download is never served from cache.
+        The content is hashed as it streams and stored once under its SHA-256
+        digest; the file is a hard link to that entry, so saving identical
+        bytes again only adds a link.
+        While the save runs, wait_for_pending_save lets other requests for the
+        same asset wait for the file instead of downloading it again.
 
         Args:
             video_id: Video identifier
-            content: Binary content to save
+            chunks: Async iterator of binary content
             variant: Type of asset (video, thumbnail, spritesheet)
 
-        Returns:
-            Path to saved file
+        Yields:
+            The same chunks, after each has been written
         """
-        try:
-            # Determine file extension
-            extensions = {
-                "video": ".mp4",
-                "thumbnail": ".webp",
-                "spritesheet": ".jpg",
-            }
-            ext = extensions.get(variant, ".bin")
+        filepath = self._file_path(video_id, variant)
+        partial_path = f"{filepath}.{uuid.uuid4().hex}.part"
 
-            # Create filename
-            filename = f"{video_id}_{variant}{ext}"
-            filepath = self.storage_path / filename
+        key = (video_id, variant)
+        done = asyncio.get_running_loop().create_future()
+        self._pending_saves[key] = done
+        saved_path = None
 
-            # Save file
-            async with aiofiles.open(filepath, "wb") as f:
-                await f.write(content)
+        try:
+            size = 0
+            digest = hashlib.sha256()
+            # One worker thread hop per chunk on a plain descriptor, rather
+            # than aiofiles' file object wrapper
+            fd = await asyncio.to_thread(os.open, partial_path, _WRITE_FLAGS, 0o644)
+            try:
+                async for chunk in chunks:
+                    await asyncio.to_thread(_write_chunk, fd, chunk, digest)
+                    size += len(chunk)
+                    yield chunk
+            finally:
+                os.close(fd)
 
-            logger.info(f"Saved {variant} to {filepath} ({len(content)} bytes)")
-            return filepath
+            # Every chunk has been sent, so a failure from here on is logged
+            # rather than raised into a response that is already complete
+            hexdigest = digest.hexdigest()
+            cas_path = os.path.join(self._cas_path_str, hexdigest[:2], hexdigest)
+            try:
+                deduped = await asyncio.to_thread(_commit_partial, partial_path, cas_path, filepath)
+            except Exception as e:
+                _unlink_if_exists(partial_path)
+                logger.error("Error storing %s for video %s: %s", variant, video_id, e, exc_info=True)
+                return
 
-        except Exception as e:
-            logger.error(f"Error saving {variant} for video {video_id}: {str(e)}", exc_info=True)
+            saved_path = Path(filepath)
+            self._path_cache[(video_id, variant)] = saved_path
+            logger.info(
+                "Saved %s to %s (%s bytes%s)", variant, filepath, size, ", deduplicated" if deduped else ""
+            )
+
+        except BaseException as e:
+            try:
+                os.unlink(partial_path)
+            except FileNotFoundError:
+                pass
+            if isinstance(e, Exception):
+                logger.error("Error saving %s for video %s: %s", variant, video_id, e, exc_info=True)
             raise
 
+        finally:
+            if self._pending_saves.get(key) is done:
+                del self._pending_saves[key]
+            done.set_result(saved_path)
+
+    async def wait_for_pending_save(
+        self,
+        video_id: str,
+        variant: Literal["video", "thumbnail", "spritesheet"] = "video",
+        timeout: float = PENDING_SAVE_TIMEOUT,
+    ) -> Optional[Path]:
+        """
+        Wait for an in-progress save of the same asset to finish.
+
+        Args:
+            video_id: Video identifier
+            variant: Type of asset
+            timeout: Maximum seconds to wait
+
+        Returns:
+            Path to the saved file, or None if no save was running, it failed
+            or it did not finish within the timeout
+        """
+        pending = self._pending_saves.get((video_id, variant))
+        if pending is None:
+            return None
+
+        logger.info("Waiting for in-progress save of %s for video %s", variant, video_id)
+        try:
+            return await asyncio.wait_for(asyncio.shield(pending), timeout)
+        except TimeoutError:
+            logger.info("In-progress save of %s for video %s still running after %ss", variant, video_id, timeout)
+            return None
+
     async def get_video_path(
         self, video_id: str, variant: Literal["video", "thumbnail", "spritesheet"] = "video"
     ) -> Optional[Path]:
@@ -72,49 +273,123 @@ class StorageService:
         Returns:
             Path if file exists, None otherwise
         """
-        extensions = {
-            "video": ".mp4",
-            "thumbnail": ".webp",
-            "spritesheet": ".jpg",
-        }
-        ext = extensions.get(variant, ".bin")
-        filename = f"{video_id}_{variant}{ext}"
-        filepath = self.storage_path / filename
+        cached = self._path_cache.get((video_id, variant))
+        if cached is not None:
+            return cached
 
-        if filepath.exists():
-            logger.debug(f"Found existing file: {filepath}")
-            return filepath
+        filepath = self._file_path(video_id, variant)
 
-        logger.debug(f"File not found: {filepath}")
+        if os.path.exists(filepath):
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Found existing file: %s", filepath)
+            path = Path(filepath)
+            self._path_cache[(video_id, variant)] = path
+            return path
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("File not found: %s", filepath)
         return None
 
+    async def stat_for_sendfile(
+        self, video_id: str, variant: Literal["video", "thumbnail", "spritesheet"], path: Path
+    ) -> Optional[os.stat_result]:
+        """
+        Stat a stored file so it can be served without a second stat.
+
+        Pass the result to FileResponse(stat_result=...), which then streams
+        the file directly (zero-copy where the ASGI server supports it).
+
+        Args:
+            video_id: Video identifier
+            variant: Type of asset
+            path: Path returned by get_video_path or wait_for_pending_save
+
+        Returns:
+            stat result, or None if the file has been removed
+        """
+        try:
+            return await asyncio.to_thread(os.stat, path)
+        except FileNotFoundError:
+            self._path_cache.pop((video_id, variant), None)
+            logger.warning("Stored file disappeared: %s", path)
+            return None
+
     async def delete_video_files(self, video_id: str) -> int:
         """
         Delete all files associated with a video ID.
 
+        Only the named links are removed; stored content no longer linked from
+        anywhere is reclaimed by the next collect_garbage run.
+
         Args:
             video_id: Video identifier
 
         Returns:
             Number of files deleted
         """
-        deleted_count = 0
+        for variant in _VARIANTS:
+            self._path_cache.pop((video_id, variant), None)
 
         try:
-            # Find all files matching the video_id pattern
-            pattern = f"{video_id}_*"
-            for filepath in self.storage_path.glob(pattern):
-                filepath.unlink()
-                deleted_count += 1
-                logger.info(f"Deleted file: {filepath}")
-
-            logger.info(f"Deleted {deleted_count} files for video {video_id}")
+            # Each variant has a fixed path, so probe those instead of scanning the directory
+            paths = [self._file_path(video_id, variant) for variant in _VARIANTS]
+            results = await asyncio.gather(*(asyncio.to_thread(_unlink_if_exists, path) for path in paths))
+
+            deleted_count = 0
+            for filepath, deleted in zip(paths, results):
+                if deleted:
+                    deleted_count += 1
+                    logger.info("Deleted file: %s", filepath)
+
+            logger.info("Deleted %s files for video %s", deleted_count, video_id)
             return deleted_count
 
         except Exception as e:
-            logger.error(f"Error deleting files for video {video_id}: {str(e)}", exc_info=True)
+            logger.error("Error deleting files for video %s: %s", video_id, e, exc_info=True)
             raise
 
+    async def collect_garbage(self, min_age: float = CAS_GC_MIN_AGE) -> int:
+        """
+        Remove stored content that no saved file links to any more.
+
+        Args:
+            min_age: Seconds an entry must be unmodified before it can be removed
+
+        Returns:
+            Number of entries removed
+        """
+        try:
+            removed = await asyncio.to_thread(_collect_cas_garbage, self._cas_path_str, min_age)
+            if removed:
+                logger.info("Removed %s unreferenced entries from content store", removed)
+            return removed
+
+        except Exception as e:
+            logger.error("Error collecting content store garbage: %s", e, exc_info=True)
+            raise
+
+    async def run_garbage_collection(self, interval: float = CAS_GC_INTERVAL) -> None:
+        """
+        Run collect_garbage now and then every interval seconds until cancelled.
+
+        Failures are logged by collect_garbage and do not stop the loop.
+
+        Args:
+            interval: Seconds between runs
+        """
+        while True:
+            try:
+                await self.collect_garbage()
+            except Exception:
+                pass
+            await asyncio.sleep(interval)
+
+    def _file_path(self, video_id: str, variant: str) -> str:
+        """Build the storage path of an asset without going through Path."""
+        return os.path.join(
+            self._storage_path_str, f"{video_id}_{variant}{VARIANT_EXTENSIONS.get(variant, '.bin')}"
+        )
+
     def get_content_type(self, variant: Literal["video", "thumbnail", "spritesheet"]) -> str:
         """
         Get MIME content type for variant.
@@ -125,9 +400,4 @@ class StorageService:
         Returns:
             MIME type string
         """
-        content_types = {
-            "video": "video/mp4",
-            "thumbnail": "image/webp",
-            "spritesheet": "image/jpeg",
-        }
-        return content_types.get(variant, "application/octet-stream")
+        return VARIANT_CONTENT_TYPES.get(variant, "application/octet-stream")
@@ -1,26 +1,56 @@
 """Logging configuration with hourly log rotation."""
 
+import atexit
 import logging
+import os
+import queue
 import sys
 from pathlib import Path
-from logging.handlers import TimedRotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, TimedRotatingFileHandler
 from datetime import datetime
+from typing import Optional
 
+try:
+    from opentelemetry import trace
+except ImportError:
+    trace = None
 
-def setup_logging(log_dir: str = "./logs", log_level: int = logging.INFO) -> logging.Logger:
+
+class TraceContextFilter(logging.Filter):
+    """Attach the current OpenTelemetry trace ID to every log record."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        trace_id = trace.get_current_span().get_span_context().trace_id if trace else 0
+        record.trace_id = format(trace_id, "032x") if trace_id else "-"
+        return True
+
+
+# Set to "0" to log to the console only; the multi-worker serve entrypoint
+# does this because workers sharing one rotating log file clobber each other
+LOG_TO_FILE_ENV = "CONTENT_GEN_LOG_TO_FILE"
+
+# Background thread that writes queued records to the log file
+_listener: Optional[QueueListener] = None
+
+
+def setup_logging(
+    log_dir: str = "./logs", log_level: int = logging.INFO, log_to_file: bool = True
+) -> logging.Logger:
     """
     Set up logging with hourly rotation and console output.
 
+    File writes (and the hourly rollover) happen on a background listener
+    thread; request code only enqueues the record.
+
     Args:
         log_dir: Directory to store log files
         log_level: Logging level (default: INFO)
+        log_to_file: Whether to write the rotating log file (default: True)
 
     Returns:
         Configured logger instance
     """
-    # Create logs directory if it doesn't exist
-    log_path = Path(log_dir)
-    log_path.mkdir(parents=True, exist_ok=True)
+    global _listener
 
     # Create logger
     logger = logging.getLogger("content_gen_backend")
@@ -31,37 +61,61 @@ def setup_logging(log_dir: str = "./logs", log_level: int = logging.INFO) -> log
 
     # Format for log messages
     formatter = logging.Formatter(
-        "%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s",
+        "%(asctime)s - %(name)s - %(levelname)s - [trace_id=%(trace_id)s] - %(funcName)s:%(lineno)d - %(message)s",
         datefmt="%Y-%m-%d %H:%M:%S",
     )
 
-    # File handler with hourly rotation
-    log_file = log_path / f"sora_api_{datetime.now().strftime('%Y%m%d')}.log"
-    file_handler = TimedRotatingFileHandler(
-        filename=log_file,
-        when="H",  # Rotate every hour
-        interval=1,
-        backupCount=168,  # Keep 7 days worth of logs (24 * 7)
-        encoding="utf-8",
-    )
-    file_handler.setLevel(log_level)
-    file_handler.setFormatter(formatter)
-    file_handler.suffix = "%Y%m%d_%H"  # Add hour to filename
+    if _listener is not None:
+        atexit.unregister(_listener.stop)
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+    if log_to_file:
+        # Create logs directory if it doesn't exist
+        log_path = Path(log_dir)
+        log_path.mkdir(parents=True, exist_ok=True)
+
+        # File handler with hourly rotation
+        log_file = log_path / f"sora_api_{datetime.now().strftime('%Y%m%d')}.log"
+        file_handler = TimedRotatingFileHandler(
+            filename=log_file,
+            when="H",  # Rotate every hour
+            interval=1,
+            backupCount=168,  # Keep 7 days worth of logs (24 * 7)
+            encoding="utf-8",
+        )
+        file_handler.setLevel(log_level)
+        file_handler.setFormatter(formatter)
+        file_handler.suffix = "%Y%m%d_%H"  # Add hour to filename
+
+        # Hand file records to a listener thread; the trace ID is attached on the
+        # calling side because span context does not cross threads
+        log_queue = queue.SimpleQueue()
+        queue_handler = QueueHandler(log_queue)
+        queue_handler.setLevel(log_level)
+        queue_handler.addFilter(TraceContextFilter())
+
+        _listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+        _listener.start()
+        atexit.register(_listener.stop)
+        logger.addHandler(queue_handler)
 
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(log_level)
     console_handler.setFormatter(formatter)
+    console_handler.addFilter(TraceContextFilter())
 
-    # Add handlers
-    logger.addHandler(file_handler)
     logger.addHandler(console_handler)
 
     logger.info("Logging initialized")
-    logger.info(f"Log files will be stored in: {log_path.absolute()}")
+    if log_to_file:
+        logger.info("Log files will be stored in: %s", log_path.absolute())
 
     return logger
 
 
 # Global logger instance
-logger = setup_logging()
+logger = setup_logging(log_to_file=os.environ.get(LOG_TO_FILE_ENV, "1") != "0")
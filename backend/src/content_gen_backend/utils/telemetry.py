@@ -0,0 +1,65 @@
+"""Optional OpenTelemetry tracing for API requests and outbound HTTP calls."""
+
+from typing import Optional
+
+from fastapi import FastAPI
+from .logging_setup import logger
+
+SERVICE_NAME = "content-gen-backend"
+
+
+def setup_telemetry(app: FastAPI, endpoint: Optional[str]) -> bool:
+    """
+    Instrument FastAPI and outbound HTTP clients and export spans to an OTLP collector.
+
+    Tracing is only enabled when an endpoint is configured and the telemetry
+    extra is installed; otherwise this is a no-op. Called from the lifespan,
+    once settings have been loaded.
+
+    Args:
+        app: FastAPI application to instrument
+        endpoint: OTLP collector base URL (OTEL_EXPORTER_OTLP_ENDPOINT)
+
+    Returns:
+        True if tracing was enabled
+    """
+    if not endpoint:
+        return False
+
+    try:
+        from opentelemetry import trace
+        from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+        from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
+        from opentelemetry.instrumentation.httpx import HTTPXClientInstrumentor
+        from opentelemetry.sdk.resources import Resource
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import BatchSpanProcessor
+    except ImportError:
+        logger.warning(
+            "OTEL_EXPORTER_OTLP_ENDPOINT is set but OpenTelemetry is not installed; "
+            "install the 'telemetry' extra to enable tracing"
+        )
+        return False
+
+    # Spans are batched in the background and shipped to the collector
+    provider = TracerProvider(resource=Resource.create({"service.name": SERVICE_NAME}))
+    provider.add_span_processor(
+        BatchSpanProcessor(OTLPSpanExporter(endpoint=f"{endpoint.rstrip('/')}/v1/traces"))
+    )
+    trace.set_tracer_provider(provider)
+
+    FastAPIInstrumentor.instrument_app(app)
+    # Starlette built the middleware stack before the lifespan ran; drop it
+    # so the first request rebuilds it with the tracing middleware included
+    app.middleware_stack = None
+    HTTPXClientInstrumentor().instrument()
+    try:
+        # OpenAI calls go over aiohttp when the openai aiohttp extra is installed
+        from opentelemetry.instrumentation.aiohttp_client import AioHttpClientInstrumentor
+    except ImportError:
+        pass
+    else:
+        AioHttpClientInstrumentor().instrument()
+
+    logger.info("OpenTelemetry tracing enabled, exporting to %s", endpoint)
+    return True
@@ -0,0 +1,6 @@
+"""Shared pytest configuration."""
+
+import os
+
+# Keep test runs from creating a logs/ directory in the working tree
+os.environ.setdefault("CONTENT_GEN_LOG_TO_FILE", "0")
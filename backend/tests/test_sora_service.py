@@ -0,0 +1,57 @@
+"""Tests for converting OpenAI video objects to VideoJob."""
+
+from openai.types import Video
+
+from content_gen_backend.models.video_response import VideoJob
+from content_gen_backend.services.sora_service import _to_video_job
+
+COMPLETED = {
+    "id": "video_abc123",
+    "object": "video",
+    "status": "completed",
+    "model": "sora-2",
+    "progress": 100,
+    "prompt": "A calico cat playing piano on stage",
+    "created_at": 1758941485,
+    "completed_at": 1758941600,
+    "expires_at": 1759027885,
+    "size": "1280x720",
+    "seconds": "8",
+    "remixed_from_video_id": None,
+    "error": None,
+}
+
+FAILED = {
+    **COMPLETED,
+    "id": "video_def456",
+    "status": "failed",
+    "progress": 0,
+    "completed_at": None,
+    "remixed_from_video_id": "video_abc123",
+    "error": {"code": "moderation_blocked", "message": "Prompt was blocked"},
+}
+
+
+def _expected(sample: dict, error=None) -> VideoJob:
+    fields = {key: value for key, value in sample.items() if key in VideoJob.model_fields}
+    return VideoJob.model_validate({**fields, "error": error})
+
+
+def test_completed_video_matches_validated_model():
+    job = _to_video_job(Video.model_validate(COMPLETED))
+
+    assert job == _expected(COMPLETED)
+
+
+def test_failed_video_carries_error_detail():
+    job = _to_video_job(Video.model_validate(FAILED))
+
+    assert job == _expected(FAILED, error={"message": "Prompt was blocked", "type": "unknown"})
+
+
+def test_converted_jobs_pass_validation():
+    # model_construct skips validation, so make sure the output would pass it
+    for sample in (COMPLETED, FAILED):
+        job = _to_video_job(Video.model_validate(sample))
+
+        assert VideoJob.model_validate(job.model_dump()) == job